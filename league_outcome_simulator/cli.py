@@ -8,11 +8,13 @@ import logging
 import re
 import time
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 from tqdm import tqdm
 
 from .catalog import LEAGUES_BY_INDEX, list_leagues, resolve_league_identifier
@@ -26,6 +28,7 @@ from .utils import (
     fixture_label,
     is_headless_environment,
     parse_score_string,
+    position_counts_from_matrix,
     process_team_colors,
     sanitize_path_segment,
     stable_seed_from_text,
@@ -43,7 +46,7 @@ DEFAULT_MAX_TIME_SECONDS = 600
 DEFAULT_TARGET_PP_ERROR = 0.01
 DEFAULT_BATCH_SIZE = 50_000
 DEFAULT_TOP_TABLES = 25
-TopTableScores = dict[tuple[str, ...], float]
+TopTableScores = dict[tuple[int, ...], float]
 
 
 @dataclass(slots=True)
@@ -147,10 +150,28 @@ def load_live_snapshot(config: SimulationConfig) -> ReplaySnapshot:
                 f"Could not resolve season for tournament {tournament_id}."
             )
 
-        base_table = client.get_league_table(tournament_id, season_id)
-        home_table = client.get_home_league_table(tournament_id, season_id)
-        away_table = client.get_away_league_table(tournament_id, season_id)
-        fixtures = client.get_remaining_fixtures(tournament_id, season_id)
+        # The standings scopes and the fixtures list are independent
+        # endpoints, so fetch them concurrently; each call still goes
+        # through the client's cache.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            base_future = executor.submit(
+                client.get_league_table, tournament_id, season_id
+            )
+            home_future = executor.submit(
+                client.get_home_league_table, tournament_id, season_id
+            )
+            away_future = executor.submit(
+                client.get_away_league_table, tournament_id, season_id
+            )
+            fixtures_future = executor.submit(
+                client.get_remaining_fixtures, tournament_id, season_id
+            )
+            base_table = base_future.result()
+            home_table = home_future.result()
+            away_table = away_future.result()
+            fixtures = fixtures_future.result()
+        # Colors come from the standings/total payload the base-table
+        # fetch just cached, so this stays a cheap serial call.
         team_colors = client.get_team_colors(tournament_id, season_id)
         metadata = client.get_season_metadata(tournament_id, season_id)
         metadata.update(
@@ -311,9 +332,9 @@ def run_simulation(config: SimulationConfig) -> dict[str, Any]:
         seed,
     )
 
-    position_counts = {
-        team: Counter() for team in [row[0] for row in snapshot.base_table[1:]]
-    }
+    team_names = [row[0] for row in snapshot.base_table[1:]]
+    team_index = {team: index for index, team in enumerate(team_names)}
+    counts = np.zeros((len(team_names), len(team_names)), dtype=np.int64)
     top_tables_counter: TopTableScores = {}
     start_time = time.time()
     sim_count_completed = 0
@@ -358,15 +379,18 @@ def run_simulation(config: SimulationConfig) -> dict[str, Any]:
 
             batch_positions = bulk_results["position_counts"]
             for team, pos_dict in batch_positions.items():
+                row = counts[team_index[team]]
                 for pos, count in pos_dict.items():
-                    position_counts[team][int(pos)] += int(count)
+                    row[int(pos) - 1] += int(count)
 
             for table_entry in bulk_results.get("top_tables", []):
                 batch_count = int(table_entry["count"])
                 if batch_count <= 0:
                     continue
                 weight = batch_count / current_batch
-                table_key = tuple(str(team) for team in table_entry["table"])
+                table_key = tuple(
+                    team_index[str(team)] for team in table_entry["table"]
+                )
                 current_score = top_tables_counter.get(table_key, 0.0)
                 top_tables_counter[table_key] = current_score + weight
 
@@ -385,9 +409,9 @@ def run_simulation(config: SimulationConfig) -> dict[str, Any]:
             current_time = time.time()
             if current_time - last_error_update_time >= 2 and sim_count_completed > 0:
                 pp_error = calculate_pp_error(
-                    position_counts,
+                    counts,
                     sim_count_completed,
-                    len(position_counts),
+                    len(team_names),
                 )
                 progress.set_postfix_str(f"Error: {pp_error:.3f} pp")
                 if pp_error <= config.target_pp_error:
@@ -400,18 +424,26 @@ def run_simulation(config: SimulationConfig) -> dict[str, Any]:
 
     elapsed_time = time.time() - start_time
     num_simulations = sim_count_completed
+    position_counts = position_counts_from_matrix(team_names, counts)
     final_pp_error = calculate_pp_error(
         position_counts,
         num_simulations,
-        len(position_counts),
+        len(team_names),
     )
 
     processed_colors = process_team_colors(snapshot.team_colors)
+    # The tracker keys tables by team index; reports need names.
+    named_top_tables = Counter(
+        {
+            tuple(team_names[index] for index in table): score
+            for table, score in top_tables_counter.items()
+        }
+    )
     print_simulation_results(
         position_counts,
         num_simulations,
         snapshot.base_table,
-        Counter(top_tables_counter),
+        named_top_tables,
         run_dir,
         elapsed_time,
         len(snapshot.fixtures),
@@ -453,7 +485,7 @@ def run_simulation(config: SimulationConfig) -> dict[str, Any]:
         ),
         "top_tables": [
             {
-                "table": list(table),
+                "table": [team_names[index] for index in table],
                 "score": count,
             }
             for table, count in sorted(
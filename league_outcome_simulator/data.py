@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -95,9 +96,21 @@ class SofaScoreClient:
         filename = f"{stable_seed_from_text(url):010d}.json"
         return self.cache_dir / filename
 
-    def fetch_json(self, url: str, *, force_refresh: bool = False) -> Any:
-        """Fetch JSON data from a URL with cache and retries."""
+    def fetch_json(
+        self,
+        url: str,
+        *,
+        force_refresh: bool = False,
+        retries: int | None = None,
+    ) -> Any:
+        """Fetch JSON data from a URL with cache and retries.
+
+        ``retries`` overrides the client-wide retry count; speculative
+        requests pass 1 so an expected failure does not pay back-off.
+        """
         force_refresh = force_refresh or self.force_refresh
+        if retries is None:
+            retries = self.retries
         if not force_refresh and url in self.json_cache:
             LOGGER.debug("Cache hit for %s", url)
             return self.json_cache[url]
@@ -110,7 +123,7 @@ class SofaScoreClient:
             return payload
 
         last_error: Exception | None = None
-        for attempt in range(1, self.retries + 1):
+        for attempt in range(1, retries + 1):
             try:
                 response = self.session.get(
                     url,
@@ -132,10 +145,10 @@ class SofaScoreClient:
                     "Failed to fetch %s on attempt %s/%s: %s",
                     url,
                     attempt,
-                    self.retries,
+                    retries,
                     exc,
                 )
-                if attempt < self.retries:
+                if attempt < retries:
                     time.sleep(self.retry_delay * attempt)
 
         raise RuntimeError(f"Could not fetch SofaScore URL: {url}") from last_error
@@ -291,10 +304,14 @@ class SofaScoreClient:
         season_id: int,
         direction: str,
         page: int,
+        *,
+        retries: int | None = None,
     ) -> dict[str, Any]:
         """Return a page of events in a given direction."""
         url = f"{self.BASE_URL}/unique-tournament/{tournament_id}/season/{season_id}/events/{direction}/{page}"
-        return self.fetch_json(url)
+        return self.fetch_json(url, retries=retries)
+
+    _EVENT_PAGE_PREFETCH = 4
 
     def _collect_events(
         self,
@@ -302,22 +319,52 @@ class SofaScoreClient:
         season_id: int,
         direction: str,
     ) -> list[dict[str, Any]]:
+        # Pages are fetched speculatively in small concurrent chunks but
+        # consumed strictly in order, so the stop conditions (empty page
+        # or hasNextPage false) behave exactly like the sequential loop.
+        # Out-of-range pages are expected to error, so speculative pages
+        # (everything past page 0) are requested with a single attempt to
+        # avoid retry back-off for pages that may not exist. A consumed
+        # page always follows a predecessor that reported hasNextPage,
+        # so a failure there is transient, not end-of-data: it is
+        # re-fetched with the full retry policy and raises if it
+        # persists, exactly like the sequential loop did.
         events: list[dict[str, Any]] = []
-        page = 0
-        while True:
-            try:
-                data = self.get_events_page(tournament_id, season_id, direction, page)
-            except RuntimeError:
-                if page == 0:
-                    return []
-                raise
-            page_events = data.get("events", [])
-            if not page_events:
-                break
-            events.extend(page_events)
-            if not data.get("hasNextPage"):
-                break
-            page += 1
+        base = 0
+        with ThreadPoolExecutor(max_workers=self._EVENT_PAGE_PREFETCH) as executor:
+            while True:
+                futures = [
+                    executor.submit(
+                        self.get_events_page,
+                        tournament_id,
+                        season_id,
+                        direction,
+                        base + offset,
+                        retries=None if base + offset == 0 else 1,
+                    )
+                    for offset in range(self._EVENT_PAGE_PREFETCH)
+                ]
+                done = False
+                for offset, future in enumerate(futures):
+                    try:
+                        data = future.result()
+                    except RuntimeError:
+                        if base + offset == 0:
+                            return []
+                        data = self.get_events_page(
+                            tournament_id, season_id, direction, base + offset
+                        )
+                    page_events = data.get("events", [])
+                    if not page_events:
+                        done = True
+                        break
+                    events.extend(page_events)
+                    if not data.get("hasNextPage"):
+                        done = True
+                        break
+                if done:
+                    break
+                base += self._EVENT_PAGE_PREFETCH
         return events
 
     def get_remaining_fixtures(
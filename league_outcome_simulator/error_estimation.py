@@ -6,20 +6,25 @@ import numpy as np
 
 
 def calculate_pp_error(position_counts, num_simulations, num_teams) -> float:
-    """Calculate the average standard error in percentage points."""
+    """Calculate the average standard error in percentage points.
+
+    ``position_counts`` is either a ``(teams, positions)`` count matrix
+    or the legacy ``{team: {position: count}}`` mapping.
+    """
     if num_simulations <= 0:
         return 0.0
 
-    total_error_sum = 0.0
-    num_probabilities_calculated = 0
-
-    for team_positions in position_counts.values():
-        for position in range(1, num_teams + 1):
-            p = team_positions.get(position, 0) / num_simulations
-            std_error_pp = np.sqrt(p * (1 - p) / num_simulations) * 100
-            total_error_sum += float(std_error_pp)
-            num_probabilities_calculated += 1
+    if isinstance(position_counts, np.ndarray):
+        counts = position_counts[:, :num_teams].astype(np.float64)
+    else:
+        counts = np.zeros((len(position_counts), num_teams))
+        for row, team_positions in zip(counts, position_counts.values()):
+            for position, count in team_positions.items():
+                if 1 <= position <= num_teams:
+                    row[position - 1] = count
 
-    if num_probabilities_calculated == 0:
+    if counts.size == 0:
         return 0.0
-    return total_error_sum / num_probabilities_calculated
+    p = counts / num_simulations
+    errors = np.sqrt(p * (1 - p) / num_simulations) * 100
+    return float(errors.mean())
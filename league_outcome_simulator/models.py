@@ -2,26 +2,67 @@
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 import numpy as np
+from scipy import optimize
 
-from .utils import get_nearest_lambda, precompute_poisson_matrix_optimized
+from .utils import precompute_poisson_table
+
+
+@lru_cache(maxsize=8)
+def _shared_poisson_table(
+    max_lambda: float, lambda_step: float, max_goals: int
+) -> np.ndarray:
+    """Build the sampling table once per parameter set and share it.
+
+    Cross-validation and rho re-estimation loops construct many models
+    with identical parameters; the table is marked read-only so sharing
+    across instances is safe.
+    """
+    table = precompute_poisson_table(max_lambda, lambda_step, max_goals).astype(
+        np.float32
+    )
+    table.setflags(write=False)
+    return table
+
+
+def dixon_coles_tau(x, y, lambda_x, lambda_y, rho):
+    """Dixon-Coles low-score correction factor."""
+    if x == 0 and y == 0:
+        return 1 - lambda_x * lambda_y * rho
+    if x == 0 and y == 1:
+        return 1 + lambda_x * rho
+    if x == 1 and y == 0:
+        return 1 + lambda_y * rho
+    if x == 1 and y == 1:
+        return 1 - rho
+    return 1.0
 
 
 class DixonColesModel:
     """Pure Python fallback model for experimentation and tests."""
 
-    def __init__(self, rho: float = -0.1, max_goals: int = 8):
+    def __init__(
+        self, rho: float = -0.1, max_goals: int = 8, seed: int | None = None
+    ):
         self.rho = rho
         self.max_goals = max_goals
+        self.rng = np.random.default_rng(seed)
         self.home_lambdas: dict[str, float] = {}
         self.away_lambdas: dict[str, float] = {}
         self.global_lambdas: dict[str, float] = {}
-        self.poisson_cache = precompute_poisson_matrix_optimized(
-            max_lambda=5.0,
-            lambda_step=0.02,
-            max_goals=max_goals + 5,
+        self._resolved_home: dict[str, float] = {}
+        self._resolved_away: dict[str, float] = {}
+        self._cdf_cache: dict[tuple[int, int], np.ndarray] = {}
+        self._home_advantage: float | None = None
+        self._home_with_advantage: dict[str, float] = {}
+        self.lambda_step = 0.02
+        # Single precision is plenty for weighting a categorical draw and
+        # halves the bandwidth of the batched tensor path; the likelihood
+        # code does not read this table and stays in float64.
+        self.poisson_table = _shared_poisson_table(
+            5.0, self.lambda_step, max_goals + 5
         )
 
     def calculate_lambdas(self, base_table, home_table=None, away_table=None):
@@ -53,50 +94,373 @@ class DixonColesModel:
                     goals_for / matches if matches > 0 else 1.0
                 )
 
+        # Resolve the home/global and away/global fallbacks once so match
+        # simulation is a single dict lookup per side instead of a .get chain.
+        self._resolved_home = {
+            team: self.home_lambdas.get(team, lam)
+            for team, lam in self.global_lambdas.items()
+        }
+        self._resolved_away = {
+            team: self.away_lambdas.get(team, lam)
+            for team, lam in self.global_lambdas.items()
+        }
+        self._cdf_cache.clear()
+        self._home_advantage = None
+
+    def set_home_advantage(self, home_advantage: float) -> None:
+        """Cache per-team home lambdas with the advantage factor applied.
+
+        A Monte Carlo run multiplies the same lambda by the same factor
+        for every fixture in every iteration; folding it in once turns
+        that into a plain dict lookup.
+        """
+        if home_advantage == self._home_advantage:
+            return
+        self._home_advantage = home_advantage
+        self._home_with_advantage = {
+            team: lam * home_advantage for team, lam in self._resolved_home.items()
+        }
+
     def tau(self, x, y, lambda_x, lambda_y, rho):
-        if x == 0 and y == 0:
-            return 1 - lambda_x * lambda_y * rho
-        if x == 0 and y == 1:
-            return 1 + lambda_x * rho
-        if x == 1 and y == 0:
-            return 1 + lambda_y * rho
-        if x == 1 and y == 1:
-            return 1 - rho
-        return 1.0
+        return dixon_coles_tau(x, y, lambda_x, lambda_y, rho)
 
-    def simulate_match(self, h_team, a_team, home_advantage: float = 1.25):
-        lambda_home = self.home_lambdas.get(
-            h_team, self.global_lambdas.get(h_team, 1.0)
-        )
-        lambda_home *= home_advantage
-        lambda_away = self.away_lambdas.get(
-            a_team, self.global_lambdas.get(a_team, 1.0)
-        )
-        lambda_home = get_nearest_lambda(lambda_home)
-        lambda_away = get_nearest_lambda(lambda_away)
-
-        prob_matrix = np.zeros((self.max_goals + 1, self.max_goals + 1))
-        for x in range(self.max_goals + 1):
-            for y in range(self.max_goals + 1):
-                p_x = self.poisson_cache[(lambda_home, x)]
-                p_y = self.poisson_cache[(lambda_away, y)]
-                prob_matrix[x, y] = (
-                    p_x * p_y * self.tau(x, y, lambda_home, lambda_away, self.rho)
-                )
+    def synthetic_match_history(self):
+        """Build a weighted pseudo match history from the fitted lambdas.
+
+        Pairing every home team with every away team would enumerate
+        T*(T-1) entries whose rounded scores collapse to a handful of
+        distinct outcomes. Binning each side's lambdas first produces
+        the same weighted distribution in O(T), with the team closest
+        to each bin's mean lambda standing in for its members.
+        """
+
+        def bins(resolved: dict[str, float]) -> dict[int, tuple[str, int]]:
+            totals: dict[int, tuple[float, int]] = {}
+            for lam in resolved.values():
+                goals = round(lam)
+                total, count = totals.get(goals, (0.0, 0))
+                totals[goals] = (total + lam, count + 1)
+            grouped: dict[int, tuple[str, int]] = {}
+            distances: dict[int, float] = {}
+            for team, lam in resolved.items():
+                goals = round(lam)
+                total, count = totals[goals]
+                distance = abs(lam - total / count)
+                if goals not in grouped or distance < distances[goals]:
+                    grouped[goals] = (team, count)
+                    distances[goals] = distance
+            return grouped
+
+        home_bins = bins(self._resolved_home)
+        away_bins = bins(self._resolved_away)
+        return [
+            (home_team, away_team, home_goals, away_goals, home_count * away_count)
+            for home_goals, (home_team, home_count) in home_bins.items()
+            for away_goals, (away_team, away_count) in away_bins.items()
+        ]
+
+    def estimate_rho(
+        self, match_history=None, bounds: tuple[float, float] = (-0.2, 0.2)
+    ) -> float:
+        """Fit rho by maximum likelihood over observed results.
+
+        ``match_history`` holds ``(home_team, away_team, home_goals,
+        away_goals)`` tuples with an optional fifth weight element;
+        when omitted, the weighted pseudo history from
+        synthetic_match_history is used instead. Only the tau
+        correction depends on rho, so the fit reduces to a root find
+        on the analytic derivative of the negative log-likelihood,
+        restricted to the four low-score categories.
+        """
+        if match_history is None:
+            match_history = self.synthetic_match_history()
+        categories: dict[tuple[int, int], list[tuple[float, float]]] = {
+            (0, 0): [],
+            (0, 1): [],
+            (1, 0): [],
+            (1, 1): [],
+        }
+        for entry in match_history:
+            h_team, a_team, home_goals, away_goals = entry[:4]
+            score = (int(home_goals), int(away_goals))
+            if score not in categories:
+                continue
+            weight = float(entry[4]) if len(entry) > 4 else 1.0
+            lambda_home = self._resolved_home.get(h_team, 1.0)
+            lambda_away = self._resolved_away.get(a_team, 1.0)
+            if score == (0, 0):
+                value = lambda_home * lambda_away
+            elif score == (0, 1):
+                value = lambda_home
+            elif score == (1, 0):
+                value = lambda_away
+            else:
+                value = 1.0
+            categories[score].append((value, weight))
+
+        if not any(categories.values()):
+            return self.rho
+
+        terms = {
+            score: (
+                np.array([value for value, _ in pairs]),
+                np.array([weight for _, weight in pairs]),
+            )
+            for score, pairs in categories.items()
+        }
+        p00, w00 = terms[(0, 0)]
+        l01, w01 = terms[(0, 1)]
+        l10, w10 = terms[(1, 0)]
+        _, w11 = terms[(1, 1)]
+        weight_11 = w11.sum()
+
+        # Keep every tau factor strictly positive inside the bracket.
+        low, high = bounds
+        if p00.size:
+            high = min(high, 0.999 / p00.max())
+        if l01.size:
+            low = max(low, -0.999 / l01.max())
+        if l10.size:
+            low = max(low, -0.999 / l10.max())
+
+        def gradient(rho: float) -> float:
+            value = float(np.sum(w00 * p00 / (1 - p00 * rho)))
+            value -= float(np.sum(w01 * l01 / (1 + l01 * rho)))
+            value -= float(np.sum(w10 * l10 / (1 + l10 * rho)))
+            value += weight_11 / (1 - rho)
+            return value
+
+        # The NLL is convex in rho, so the gradient is monotone: a sign
+        # check at the bracket ends either pins the minimum to a bound
+        # or guarantees brentq a root.
+        if gradient(low) >= 0:
+            rho = low
+        elif gradient(high) <= 0:
+            rho = high
+        else:
+            rho = float(optimize.brentq(gradient, low, high))
+
+        self.rho = rho
+        self._cdf_cache.clear()
+        return rho
+
+    def _match_lambdas(
+        self, h_team: str, a_team: str, home_advantage: float
+    ) -> tuple[float, float]:
+        self.set_home_advantage(home_advantage)
+        lambda_home = self._home_with_advantage.get(h_team, home_advantage)
+        lambda_away = self._resolved_away.get(a_team, 1.0)
+        return lambda_home, lambda_away
+
+    def _lambda_index(self, value: float) -> int:
+        """Snap a lambda to the nearest row of the precomputed Poisson table."""
+        index = int(round(value / self.lambda_step))
+        return min(max(index, 0), self.poisson_table.shape[0] - 1)
+
+    def _match_probability_matrix(
+        self, lambda_home: float, lambda_away: float
+    ) -> np.ndarray:
+        goals = self.max_goals + 1
+        p_home = self.poisson_table[self._lambda_index(lambda_home), :goals]
+        p_away = self.poisson_table[self._lambda_index(lambda_away), :goals]
+        prob_matrix = np.outer(p_home, p_away)
+        # tau only differs from 1.0 on the four low-score cells, so apply it
+        # as a patch instead of calling it for every cell. Only the 0-0
+        # cell exists when max_goals is 0.
+        prob_matrix[0, 0] *= 1 - lambda_home * lambda_away * self.rho
+        if self.max_goals >= 1:
+            prob_matrix[0, 1] *= 1 + lambda_home * self.rho
+            prob_matrix[1, 0] *= 1 + lambda_away * self.rho
+            prob_matrix[1, 1] *= 1 - self.rho
+        # Not normalized: the truncated tail mass is negligible and the
+        # samplers scale their uniforms by the CDF total instead, saving
+        # a full-matrix divide per distinct lambda pair.
+        return prob_matrix
 
-        prob_matrix /= prob_matrix.sum()
-        flat_index = np.random.choice(
-            len(prob_matrix.flatten()), p=prob_matrix.flatten()
+    def _match_cdf(self, lambda_home: float, lambda_away: float) -> np.ndarray:
+        """Return the flat score CDF, cached per snapped lambda pair.
+
+        Season simulations revisit the same fixture list thousands of
+        times, so the distribution for a given lambda pair is built once
+        and every later draw is a cache hit.
+        """
+        key = (self._lambda_index(lambda_home), self._lambda_index(lambda_away))
+        cdf = self._cdf_cache.get(key)
+        if cdf is None:
+            snapped_home = key[0] * self.lambda_step
+            snapped_away = key[1] * self.lambda_step
+            pmf = self._match_probability_matrix(snapped_home, snapped_away)
+            cdf = np.cumsum(pmf.ravel())
+            self._cdf_cache[key] = cdf
+        return cdf
+
+    def simulate_match(self, h_team, a_team, home_advantage: float = 1.25):
+        lambda_home, lambda_away = self._match_lambdas(h_team, a_team, home_advantage)
+        cdf = self._match_cdf(lambda_home, lambda_away)
+        # The scaled uniform can round up to exactly cdf[-1]; clamp to the
+        # last cell like the Rust kernel does.
+        flat_index = min(
+            int(np.searchsorted(cdf, self.rng.random() * cdf[-1], side="right")),
+            cdf.size - 1,
         )
         home_goals = flat_index // (self.max_goals + 1)
         away_goals = flat_index % (self.max_goals + 1)
         return home_goals, away_goals
 
-    def simulate_matches_parallel(self, matches, home_advantage: float = 1.25):
-        def simulate(match):
-            return self.simulate_match(
-                match["h"]["title"], match["a"]["title"], home_advantage
+    def prepare_fixtures(
+        self, matches, home_advantage: float = 1.25
+    ) -> np.ndarray:
+        """Precompute the per-fixture CDF stack for repeated replicates.
+
+        The lambda pairs of a fixture list do not change between Monte
+        Carlo iterations, so the (fixtures, scores) cumulative matrix
+        can be built once and every replicate reduced to drawing
+        uniforms against it via simulate_prepared.
+        """
+        goals = self.max_goals + 1
+        if not matches:
+            return np.empty((0, goals * goals))
+
+        self.set_home_advantage(home_advantage)
+        lambdas_home = np.array(
+            [
+                self._home_with_advantage.get(match["h"]["title"], home_advantage)
+                for match in matches
+            ]
+        )
+        lambdas_away = np.array(
+            [self._resolved_away.get(match["a"]["title"], 1.0) for match in matches]
+        )
+        max_index = self.poisson_table.shape[0] - 1
+        indices_home = np.rint(lambdas_home / self.lambda_step).astype(np.intp)
+        indices_away = np.rint(lambdas_away / self.lambda_step).astype(np.intp)
+        np.clip(indices_home, 0, max_index, out=indices_home)
+        np.clip(indices_away, 0, max_index, out=indices_away)
+
+        p_home = self.poisson_table[indices_home, :goals]
+        p_away = self.poisson_table[indices_away, :goals]
+        stack = p_home[:, :, None] * p_away[:, None, :]
+        stack[:, 0, 0] *= 1 - lambdas_home * lambdas_away * self.rho
+        if self.max_goals >= 1:
+            stack[:, 0, 1] *= 1 + lambdas_home * self.rho
+            stack[:, 1, 0] *= 1 + lambdas_away * self.rho
+            stack[:, 1, 1] *= 1 - self.rho
+
+        # Unnormalized, like _match_probability_matrix: consumers scale
+        # their uniforms by the last CDF column.
+        return np.cumsum(stack.reshape(len(matches), -1), axis=1)
+
+    def simulate_prepared(self, cdf: np.ndarray):
+        """Draw one outcome per fixture from a prepared CDF stack."""
+        if cdf.shape[0] == 0:
+            return []
+        u = self.rng.random((cdf.shape[0], 1)) * cdf[:, -1:]
+        outcomes = (u < cdf).argmax(axis=1)
+        # When the scaled uniform rounds up to the CDF total, no cell
+        # compares True and argmax falls through to 0; clamp that edge
+        # to the last cell like the scalar path.
+        outcomes[u[:, 0] >= cdf[:, -1]] = cdf.shape[1] - 1
+        return [divmod(int(outcome), self.max_goals + 1) for outcome in outcomes]
+
+    def simulate_matches(self, matches, home_advantage: float = 1.25):
+        """Simulate all matches with one vectorized draw across fixtures."""
+        return self.simulate_prepared(self.prepare_fixtures(matches, home_advantage))
+
+    def simulate_season_counts(
+        self, base_table, matches, num_simulations: int, home_advantage: float = 1.25
+    ):
+        """Run all season replicates as NumPy tensor ops and tally positions.
+
+        Instead of looping fixtures and standings dicts per replicate,
+        every replicate's scores are drawn against the prepared CDF
+        stack at once and points/goals are accumulated into structure-
+        of-arrays stats indexed by integer team id. Rankings replicate
+        the sort_table_rows tie-breakers (points, goal difference,
+        goals for, name). Returns ``(team_names, counts)`` where
+        ``counts[i, p]`` is how often team ``i`` finished in position
+        ``p + 1``, matching the layout of position_counts_from_matrix.
+        """
+        team_names = [row[0] for row in base_table[1:]]
+        team_count = len(team_names)
+        team_ids = {team: index for index, team in enumerate(team_names)}
+        counts = np.zeros((team_count, team_count), dtype=np.int64)
+        if num_simulations <= 0 or team_count == 0:
+            return team_names, counts
+
+        base_points = np.array(
+            [int(row[7]) for row in base_table[1:]], dtype=np.int64
+        )
+        base_goals_for = np.array(
+            [int(row[5]) for row in base_table[1:]], dtype=np.int64
+        )
+        base_goals_against = np.array(
+            [int(row[6]) for row in base_table[1:]], dtype=np.int64
+        )
+        points = np.repeat(base_points[None, :], num_simulations, axis=0)
+        goals_for = np.repeat(base_goals_for[None, :], num_simulations, axis=0)
+        goals_against = np.repeat(
+            base_goals_against[None, :], num_simulations, axis=0
+        )
+
+        fixtures = [
+            match
+            for match in matches
+            if match["h"]["title"] in team_ids and match["a"]["title"] in team_ids
+        ]
+        if fixtures:
+            cdf = self.prepare_fixtures(fixtures, home_advantage)
+            home_idx = np.array(
+                [team_ids[match["h"]["title"]] for match in fixtures], dtype=np.intp
+            )
+            away_idx = np.array(
+                [team_ids[match["a"]["title"]] for match in fixtures], dtype=np.intp
             )
+            goals = self.max_goals + 1
+            uniforms = self.rng.random((num_simulations, len(fixtures))) * cdf[:, -1]
+            outcomes = np.empty((num_simulations, len(fixtures)), dtype=np.intp)
+            # Sampling per fixture keeps each searchsorted a contiguous
+            # binary search instead of materializing the full
+            # (sims, fixtures, scores) comparison tensor.
+            for fixture in range(len(fixtures)):
+                outcomes[:, fixture] = np.searchsorted(
+                    cdf[fixture], uniforms[:, fixture], side="right"
+                )
+            # Clamp the rare uniform == CDF-total edge to the last cell,
+            # matching the other sampling paths.
+            np.minimum(outcomes, goals * goals - 1, out=outcomes)
+            home_goals = outcomes // goals
+            away_goals = outcomes % goals
+
+            home_points = 3 * (home_goals > away_goals) + (home_goals == away_goals)
+            away_points = 3 * (away_goals > home_goals) + (home_goals == away_goals)
+            sim_rows = np.arange(num_simulations)[:, None]
+            np.add.at(points, (sim_rows, home_idx[None, :]), home_points)
+            np.add.at(points, (sim_rows, away_idx[None, :]), away_points)
+            np.add.at(goals_for, (sim_rows, home_idx[None, :]), home_goals)
+            np.add.at(goals_against, (sim_rows, home_idx[None, :]), away_goals)
+            np.add.at(goals_for, (sim_rows, away_idx[None, :]), away_goals)
+            np.add.at(goals_against, (sim_rows, away_idx[None, :]), home_goals)
 
-        with ThreadPoolExecutor() as executor:
-            return list(executor.map(simulate, matches))
+        name_rank = np.empty(team_count, dtype=np.int64)
+        name_rank[np.argsort([team.lower() for team in team_names])] = np.arange(
+            team_count
+        )
+        order = np.lexsort(
+            (
+                np.broadcast_to(name_rank, points.shape),
+                -goals_for,
+                -(goals_for - goals_against),
+                -points,
+            ),
+            axis=-1,
+        )
+        np.add.at(
+            counts,
+            (order.ravel(), np.tile(np.arange(team_count), num_simulations)),
+            1,
+        )
+        return team_names, counts
+
+    def simulate_matches_parallel(self, matches, home_advantage: float = 1.25):
+        """Deprecated alias kept for callers of the old thread-pool API."""
+        return self.simulate_matches(matches, home_advantage)
@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import colorsys
+import hashlib
 import json
-import math
 import os
 import random
 import re
 import sys
 from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable
 
+import numpy as np
+from scipy.special import gammaln
+
 
 TEAM_ROW_HEADER = ["Team", "M", "W", "D", "L", "G", "GA", "PTS"]
 
@@ -58,10 +63,17 @@ def write_json(path: Path, payload: dict) -> None:
     )
 
 
+@lru_cache(maxsize=None)
+def _hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
+    """Parse #rrggbb into an (r, g, b) tuple once per distinct color."""
+    r, g, b = bytes.fromhex(hex_color.lstrip("#"))
+    return r, g, b
+
+
+@lru_cache(maxsize=None)
 def get_color_luminance(hex_color: str) -> float:
     """Calculate the perceived brightness of a color (0-255)."""
-    hex_color = hex_color.lstrip("#")
-    r, g, b = int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
+    r, g, b = _hex_to_rgb(hex_color)
     return 0.299 * r + 0.587 * g + 0.114 * b
 
 
@@ -70,32 +82,53 @@ def get_contrasting_text_color(hex_color: str) -> str:
     return "#000000" if get_color_luminance(hex_color) > 128 else "#FFFFFF"
 
 
+@lru_cache(maxsize=None)
 def are_colors_similar(color1: str, color2: str, threshold: int = 60) -> bool:
     """Check if two colors are similar based on RGB distance."""
-    c1 = color1.lstrip("#")
-    c2 = color2.lstrip("#")
-    r1, g1, b1 = int(c1[0:2], 16), int(c1[2:4], 16), int(c1[4:6], 16)
-    r2, g2, b2 = int(c2[0:2], 16), int(c2[2:4], 16), int(c2[4:6], 16)
-    distance = ((r1 - r2) ** 2 + (g1 - g2) ** 2 + (b1 - b2) ** 2) ** 0.5
-    return distance < threshold
+    r1, g1, b1 = _hex_to_rgb(color1)
+    r2, g2, b2 = _hex_to_rgb(color2)
+    # Compare squared distances so no square root is needed.
+    distance_sq = (r1 - r2) ** 2 + (g1 - g2) ** 2 + (b1 - b2) ** 2
+    return distance_sq < threshold * threshold
+
+
+def any_similar_color(
+    palette: Iterable[str], color: str, threshold: int = 60
+) -> bool:
+    """Check one color against a whole palette in a single NumPy pass."""
+    rgb_rows = [_hex_to_rgb(entry) for entry in palette]
+    if not rgb_rows:
+        return False
+    diff = np.array(rgb_rows, dtype=np.int64) - np.array(
+        _hex_to_rgb(color), dtype=np.int64
+    )
+    return bool(((diff * diff).sum(axis=1) < threshold * threshold).any())
 
 
+@lru_cache(maxsize=None)
 def darken_color(hex_color: str, factor: float = 0.7) -> str:
     """Darken a color by multiplying RGB components by factor."""
-    hex_color = hex_color.lstrip("#")
-    r, g, b = int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
+    r, g, b = _hex_to_rgb(hex_color)
     r = max(0, min(255, int(r * factor)))
     g = max(0, min(255, int(g * factor)))
     b = max(0, min(255, int(b * factor)))
     return f"#{r:02x}{g:02x}{b:02x}"
 
 
+@lru_cache(maxsize=None)
+def _stable_name_hash(team_name: str) -> int:
+    """Collision-resistant 32-bit hash of a team name."""
+    digest = hashlib.blake2s(team_name.encode("utf-8"), digest_size=4).digest()
+    return int.from_bytes(digest, "little")
+
+
+@lru_cache(maxsize=None)
 def deterministic_hex_color(team_name: str) -> str:
     """Generate a deterministic color based on team name."""
-    name_hash = sum(ord(c) * (i + 1) for i, c in enumerate(team_name))
-    r = (name_hash * 123) % 256
-    g = (name_hash * 457) % 256
-    b = (name_hash * 789) % 256
+    name_hash = _stable_name_hash(team_name)
+    r = (name_hash >> 16) & 0xFF
+    g = (name_hash >> 8) & 0xFF
+    b = name_hash & 0xFF
     if max(r, g, b) < 100:
         brightest = max(r, g, b)
         if brightest > 0:
@@ -108,13 +141,11 @@ def deterministic_hex_color(team_name: str) -> str:
     return f"#{r:02x}{g:02x}{b:02x}"
 
 
+@lru_cache(maxsize=None)
 def deterministic_secondary_color(team_name: str, primary_color: str) -> str:
     """Generate a secondary deterministic color."""
-    primary = primary_color.lstrip("#")
-    r = int(primary[0:2], 16)
-    g = int(primary[2:4], 16)
-    b = int(primary[4:6], 16)
-    name_hash = sum(ord(c) for c in team_name)
+    r, g, b = _hex_to_rgb(primary_color)
+    name_hash = _stable_name_hash(team_name)
 
     if name_hash % 4 == 0:
         r2, g2, b2 = 255 - r, 255 - g, 255 - b
@@ -134,12 +165,27 @@ def deterministic_secondary_color(team_name: str, primary_color: str) -> str:
     return f"#{r2:02x}{g2:02x}{b2:02x}"
 
 
+@lru_cache(maxsize=None)
+def contrasting_rotation_color(primary_color: str) -> str:
+    """Derive a contrasting companion by rotating the primary's hue.
+
+    The opposite hue plus a value pushed away from the primary's
+    brightness yields good contrast by construction, so callers never
+    need a check-and-retry loop.
+    """
+    r, g, b = _hex_to_rgb(primary_color)
+    hue, _, _ = colorsys.rgb_to_hsv(r / 255, g / 255, b / 255)
+    brightness = (r * 299 + g * 587 + b * 114) / 1000
+    value = 0.25 if brightness > 127 else 0.95
+    r2, g2, b2 = colorsys.hsv_to_rgb((hue + 0.5) % 1.0, 0.75, value)
+    return f"#{int(r2 * 255):02x}{int(g2 * 255):02x}{int(b2 * 255):02x}"
+
+
+@lru_cache(maxsize=None)
 def is_good_contrast(color1: str, color2: str, threshold: int = 120) -> bool:
     """Check if two colors have sufficient contrast."""
-    c1 = color1.lstrip("#")
-    c2 = color2.lstrip("#")
-    r1, g1, b1 = int(c1[0:2], 16), int(c1[2:4], 16), int(c1[4:6], 16)
-    r2, g2, b2 = int(c2[0:2], 16), int(c2[2:4], 16), int(c2[4:6], 16)
+    r1, g1, b1 = _hex_to_rgb(color1)
+    r2, g2, b2 = _hex_to_rgb(color2)
     brightness1 = (r1 * 299 + g1 * 587 + b1 * 114) / 1000
     brightness2 = (r2 * 299 + g2 * 587 + b2 * 114) / 1000
     brightness_diff = abs(brightness1 - brightness2)
@@ -153,12 +199,26 @@ def process_team_colors(
     """Fill in missing team colors deterministically."""
     processed_colors: dict[str, dict[str, str]] = {}
     for team_name, colors in team_colors.items():
-        primary = colors.get("primary") or deterministic_hex_color(team_name)
+        provided_primary = colors.get("primary")
+        provided_secondary = colors.get("secondary")
+        if (
+            provided_primary
+            and provided_secondary
+            and is_good_contrast(provided_primary, provided_secondary)
+        ):
+            # Already complete and readable; skip all derivation work. This
+            # keeps re-processing an already-processed mapping cheap.
+            processed_colors[team_name] = {
+                "primary": provided_primary,
+                "secondary": provided_secondary,
+            }
+            continue
+        primary = provided_primary or deterministic_hex_color(team_name)
         secondary = colors.get("secondary") or deterministic_secondary_color(
             team_name, primary
         )
         if not is_good_contrast(primary, secondary):
-            secondary = deterministic_secondary_color(f"{team_name} alt", primary)
+            secondary = contrasting_rotation_color(primary)
         processed_colors[team_name] = {"primary": primary, "secondary": secondary}
     return processed_colors
 
@@ -373,6 +433,22 @@ def random_hex_color() -> str:
     return f"#{r:02x}{g:02x}{b:02x}"
 
 
+def position_counts_from_matrix(
+    team_names: list[str], counts
+) -> dict[str, Counter]:
+    """Convert a (team, position) count matrix into the reporting dict shape."""
+    return {
+        team: Counter(
+            {
+                position: int(count)
+                for position, count in enumerate(counts[index], start=1)
+                if count
+            }
+        )
+        for index, team in enumerate(team_names)
+    }
+
+
 def summarize_probability_matrix(
     position_counts: dict[str, Counter], num_simulations: int
 ) -> list[dict[str, object]]:
@@ -391,22 +467,45 @@ def summarize_probability_matrix(
     return summary
 
 
+def precompute_poisson_table(
+    max_lambda: float = 5.0,
+    lambda_step: float = 0.02,
+    max_goals: int = 10,
+) -> np.ndarray:
+    """Precompute a (lambda index, goals) Poisson PMF table in one pass."""
+    lambdas = np.round(
+        np.arange(0.0, max_lambda + lambda_step / 2, lambda_step), 2
+    )
+    goals = np.arange(max_goals + 1)
+    log_factorial = gammaln(goals + 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_pmf = (
+            -lambdas[:, None]
+            + goals[None, :] * np.log(lambdas)[:, None]
+            - log_factorial[None, :]
+        )
+        table = np.exp(log_pmf)
+    # lambda == 0 degenerates to a certain 0-0 score.
+    table[lambdas == 0.0] = 0.0
+    table[lambdas == 0.0, 0] = 1.0
+    return table
+
+
 def precompute_poisson_matrix_optimized(
     max_lambda: float = 5.0,
     lambda_step: float = 0.02,
     max_goals: int = 10,
 ) -> dict[tuple[float, int], float]:
     """Precompute Poisson probabilities for the legacy Python model."""
-    poisson_cache: dict[tuple[float, int], float] = {}
-    current = 0.0
-    while current <= max_lambda + 1e-9:
-        rounded = round(current, 2)
-        for goals in range(max_goals + 1):
-            poisson_cache[(rounded, goals)] = (
-                math.exp(-rounded) * (rounded**goals) / math.factorial(goals)
-            )
-        current += lambda_step
-    return poisson_cache
+    table = precompute_poisson_table(max_lambda, lambda_step, max_goals)
+    lambdas = np.round(
+        np.arange(0.0, max_lambda + lambda_step / 2, lambda_step), 2
+    )
+    return {
+        (float(lam), goals): float(table[index, goals])
+        for index, lam in enumerate(lambdas)
+        for goals in range(max_goals + 1)
+    }
 
 
 def get_nearest_lambda(value: float, step: float = 0.02) -> float:
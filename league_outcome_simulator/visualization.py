@@ -6,6 +6,7 @@ from collections import Counter
 from pathlib import Path
 
 from .utils import (
+    any_similar_color,
     are_colors_similar,
     darken_color,
     format_duration,
@@ -66,6 +67,14 @@ MEDIUM_HATCH_PATTERNS = [
 ]
 
 
+def _teams_in_table_order(current_stats: dict[str, dict[str, int]]) -> list[str]:
+    """Order teams by current table position without a keyed sort."""
+    ordered: list[str] = [""] * len(current_stats)
+    for team, stats in current_stats.items():
+        ordered[stats["position"] - 1] = team
+    return ordered
+
+
 def _pick_hatch(team: str, patterns: list[str], recent_hatches: set[str]) -> str:
     """Pick a deterministic hatch while avoiding recent collisions."""
     start_index = sum((index + 1) * ord(char) for index, char in enumerate(team)) % len(
@@ -95,9 +104,8 @@ def _build_team_styles(
         similar_pair = secondary == primary or are_colors_similar(
             primary, secondary, threshold=55
         )
-        similar_to_recent = any(
-            are_colors_similar(primary, recent, threshold=85)
-            for recent in recent_primary_colors[-3:]
+        similar_to_recent = any_similar_color(
+            recent_primary_colors[-3:], primary, threshold=85
         )
 
         use_strong_pattern = large_league or similar_pair or similar_to_recent
@@ -157,43 +165,36 @@ def visualize_results(
 
     import matplotlib.pyplot as plt
     from matplotlib.patches import Patch
-    import pandas as pd
+    import numpy as np
 
     run_dir = Path(run_dir)
     run_dir.mkdir(parents=True, exist_ok=True)
     team_colors = process_team_colors(team_colors)
     current_stats = team_stats_from_table(base_table)
 
-    rows = []
-    for team, pos_counter in position_counts.items():
-        for position, count in sorted(pos_counter.items()):
-            rows.append(
-                {
-                    "Team": team,
-                    "Position": int(position),
-                    "Probability": (count / num_simulations) * 100
-                    if num_simulations
-                    else 0.0,
-                    "CurrentPosition": current_stats[team]["position"],
-                }
-            )
-    frame = pd.DataFrame(rows)
-    if frame.empty:
+    many_segments = len(current_stats) ** 2 > 200
+    if many_segments:
+        # Large leagues produce many hatched segments; keep the renderer
+        # from submitting every path individually.
+        matplotlib.rcParams["path.simplify"] = True
+        matplotlib.rcParams["path.simplify_threshold"] = 1.0
+        matplotlib.rcParams["agg.path.chunksize"] = 10_000
+
+    if not any(pos_counter for pos_counter in position_counts.values()):
         return None
 
-    pivot = frame.pivot_table(
-        index="Position",
-        columns="Team",
-        values="Probability",
-        fill_value=0.0,
-    )
-    ordered_teams = [
-        team
-        for team, _ in sorted(
-            current_stats.items(), key=lambda item: item[1]["position"]
-        )
-    ]
-    pivot = pivot.reindex(columns=ordered_teams)
+    # Pivot {team: Counter({position: count})} straight into one
+    # probability column per team; no DataFrame round-trip needed.
+    ordered_teams = _teams_in_table_order(current_stats)
+    team_count = len(ordered_teams)
+    positions_axis = np.arange(1, team_count + 1)
+    probability_columns: dict[str, np.ndarray] = {}
+    for team in ordered_teams:
+        column = np.zeros(team_count)
+        if num_simulations:
+            for position, count in position_counts.get(team, {}).items():
+                column[int(position) - 1] = (count / num_simulations) * 100
+        probability_columns[team] = column
 
     legend_columns, legend_font_size, right_margin, compact_legend = _legend_layout(
         len(ordered_teams)
@@ -205,11 +206,11 @@ def visualize_results(
     legend_handles = []
     team_styles = _build_team_styles(ordered_teams, team_colors)
     for team in ordered_teams:
-        values = pivot[team]
+        values = probability_columns[team]
         style = team_styles[team]
         label = _legend_label(team, current_stats[team], compact_legend)
-        ax.bar(
-            pivot.index,
+        bars = ax.bar(
+            positions_axis,
             values,
             bottom=bottom,
             color=style["facecolor"],
@@ -219,6 +220,12 @@ def visualize_results(
             width=0.8,
             zorder=3,
         )
+        if many_segments:
+            # Hatched patches are slow to redraw interactively; rasterize
+            # them into one bitmap per container while text and the
+            # legend stay vector. savefig's dpi keeps the output crisp.
+            for patch in bars:
+                patch.set_rasterized(True)
         legend_handles.append(
             Patch(
                 facecolor=style["facecolor"],
@@ -233,7 +240,7 @@ def visualize_results(
     ax.set_title("Probability of finishing in each position")
     ax.set_xlabel("Final position")
     ax.set_ylabel("Probability (%)")
-    ax.set_xticks(list(pivot.index))
+    ax.set_xticks(positions_axis)
     ax.set_ylim(0, 100)
     ax.grid(axis="y", linestyle="--", alpha=0.4, zorder=0)
     ax.legend(
@@ -292,12 +299,7 @@ def print_simulation_results(
     print(stats_line_1)
     print(stats_line_2)
 
-    ordered_teams = [
-        team
-        for team, _ in sorted(
-            current_stats.items(), key=lambda item: item[1]["position"]
-        )
-    ]
+    ordered_teams = _teams_in_table_order(current_stats)
     prefixes = {
         team: (
             f"{team} - {current_stats[team]['points']} pts "
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import re
 from pathlib import Path
 
 from league_outcome_simulator import cli
@@ -43,6 +44,12 @@ def test_simulate_snapshot_no_gui(tmp_path):
     assert manifest["league_name"] == "Sample League"
     assert len(manifest["position_probabilities"]) == 4
 
+    simulation_txt = manifests[0].parent / "simulation.txt"
+    report = simulation_txt.read_text(encoding="utf-8")
+    top_section = report.split("full final tables", 1)[1]
+    # Top tables must list team names, not the internal integer ids.
+    assert re.search(r"\d+:Alpha FC", top_section)
+
 
 def test_simulate_snapshot_with_what_if(tmp_path):
     exit_code = cli.main(
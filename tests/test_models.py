@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from league_outcome_simulator.models import DixonColesModel
+
+
+BASE_TABLE = [
+    ["Team", "M", "W", "D", "L", "G", "GA", "PTS"],
+    ["Alpha", 10, 6, 2, 2, 18, 9, 20],
+    ["Bravo", 10, 4, 3, 3, 12, 11, 15],
+    ["Charlie", 10, 2, 2, 6, 8, 16, 8],
+]
+
+
+def test_simulate_match_returns_valid_scores():
+    model = DixonColesModel(seed=7)
+    model.calculate_lambdas(BASE_TABLE)
+    home_goals, away_goals = model.simulate_match("Alpha", "Bravo")
+    assert 0 <= home_goals <= model.max_goals
+    assert 0 <= away_goals <= model.max_goals
+
+
+def test_simulate_matches_batch():
+    model = DixonColesModel(seed=7)
+    model.calculate_lambdas(BASE_TABLE)
+    matches = [
+        {"h": {"title": "Alpha"}, "a": {"title": "Bravo"}},
+        {"h": {"title": "Bravo"}, "a": {"title": "Charlie"}},
+        {"h": {"title": "Charlie"}, "a": {"title": "Alpha"}},
+    ]
+    results = model.simulate_matches(matches)
+    assert len(results) == 3
+    for home_goals, away_goals in results:
+        assert 0 <= home_goals <= model.max_goals
+        assert 0 <= away_goals <= model.max_goals
+    assert model.simulate_matches([]) == []
+    cdf = model.prepare_fixtures(matches)
+    for _ in range(2):
+        assert len(model.simulate_prepared(cdf)) == 3
+
+
+def test_simulate_season_counts_tallies_positions():
+    model = DixonColesModel(seed=7)
+    model.calculate_lambdas(BASE_TABLE)
+    matches = [
+        {"h": {"title": "Alpha"}, "a": {"title": "Bravo"}},
+        {"h": {"title": "Bravo"}, "a": {"title": "Charlie"}},
+    ]
+    team_names, counts = model.simulate_season_counts(BASE_TABLE, matches, 50)
+    assert team_names == ["Alpha", "Bravo", "Charlie"]
+    assert counts.shape == (3, 3)
+    assert (counts.sum(axis=1) == 50).all()
+    assert (counts.sum(axis=0) == 50).all()
+
+    # With no fixtures left every replicate reproduces the current table.
+    team_names, counts = model.simulate_season_counts(BASE_TABLE, [], 10)
+    assert counts[0, 0] == 10
+    assert counts[1, 1] == 10
+    assert counts[2, 2] == 10
+
+
+def test_estimate_rho_fits_low_score_history():
+    model = DixonColesModel(seed=7)
+    model.calculate_lambdas(BASE_TABLE)
+    history = [
+        ("Alpha", "Bravo", 0, 0),
+        ("Bravo", "Charlie", 1, 1),
+        ("Charlie", "Alpha", 1, 0),
+        ("Alpha", "Charlie", 0, 1, 2.0),
+        ("Bravo", "Alpha", 3, 2),
+    ]
+    rho = model.estimate_rho(history)
+    assert -0.2 <= rho <= 0.2
+    assert model.rho == rho
+    assert model.estimate_rho([]) == rho
+
+
+def test_estimate_rho_from_synthetic_history():
+    model = DixonColesModel(seed=7)
+    model.calculate_lambdas(BASE_TABLE)
+    history = model.synthetic_match_history()
+    # Every home bin pairs with every away bin and weights cover all pairs.
+    team_names = {row[0] for row in BASE_TABLE[1:]}
+    assert sum(entry[4] for entry in history) == len(team_names) ** 2
+    assert all(
+        entry[0] in team_names and entry[1] in team_names for entry in history
+    )
+    rho = model.estimate_rho()
+    assert -0.2 <= rho <= 0.2
+    assert model.rho == rho